@@ -1,11 +1,15 @@
 from dataclasses import dataclass
+import dataclasses
 from typing import Any, List, Optional, Union
+import asyncio
+import collections.abc
+import functools
 import inspect
-import itertools
 import warnings
 import types
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from flask_discord_interactions.models import (
     LoadableDataclass,
@@ -20,6 +24,163 @@ from flask_discord_interactions.models import (
     Component,
     Option,
 )
+from flask_discord_interactions.models.utils import json_body
+
+
+# Shared read-only fallback for lookups into the incoming interaction data.
+# It must never be stored on a Context, as mappingproxy can't be pickled.
+_EMPTY_MAPPING = types.MappingProxyType({})
+
+# Config values that a frozen Context needs in order to send followups
+_FROZEN_CONFIG_KEYS = (
+    "DISCORD_BASE_URL",
+    "DISCORD_CLIENT_ID",
+    "DONT_REGISTER_WITH_DISCORD",
+)
+
+# Default for the DISCORD_HTTP_POOL_SIZE config value
+DEFAULT_HTTP_POOL_SIZE = 100
+
+
+def create_sync_session(pool_size=DEFAULT_HTTP_POOL_SIZE):
+    """
+    Create the ``requests.Session`` used to send followup requests.
+
+    Followups are often sent from threads, so the connection pool holds up to
+    ``pool_size`` connections. With urllib3's default of 10, more concurrent
+    followups than that would discard connections and log warnings.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_sync_session():
+    """
+    Return a ``requests.Session`` shared by all contexts whose app doesn't
+    have one, e.g. frozen contexts running in an RQ or Celery worker.
+
+    Created on first use, so it is never pickled along with a frozen Context.
+    """
+    return create_sync_session()
+
+
+_BOOL_STATES = {"True": True, "False": False, "None": None}
+
+
+def _parse_bool_state(argument):
+    try:
+        return _BOOL_STATES[argument]
+    except KeyError:
+        raise ValueError(f"Invalid bool in handler state parsing: {argument}") from None
+
+
+# Handler state is stored as strings; these annotations are converted back
+_STATE_CONVERTERS = {int: int, bool: _parse_bool_state}
+
+
+@functools.lru_cache(maxsize=None)
+def _handler_converters(handler):
+    """
+    Return a function to convert each handler state argument of a custom ID
+    handler, based on the annotations of its parameters (skipping the first,
+    context parameter). Arguments that don't need converting get ``None``.
+
+    Handlers are registered once and don't change, so the result is cached
+    to avoid calling :func:`inspect.signature` on every interaction.
+    """
+    parameters = list(inspect.signature(handler).parameters.values())
+    return tuple(
+        _STATE_CONVERTERS.get(parameter.annotation) for parameter in parameters[1:]
+    )
+
+
+class _ResolvedMapping(collections.abc.Mapping):
+    """
+    A read-only mapping over one section of the ``"resolved"`` interaction
+    data, which builds each object from its raw dict on first access.
+
+    Members are sent without their user, so for the ``"members"`` section the
+    matching entry of ``"users"`` is passed as ``users`` and joined in.
+    """
+
+    def __init__(self, raw, model, users=None):
+        self._raw = raw or {}
+        self._model = model
+        self._users = users
+        self._loaded = {}
+
+    def __getitem__(self, id):
+        if id not in self._loaded:
+            data = self._raw[id]
+            if self._users is not None:
+                data = {**data, "user": self._users[id]}
+            self._loaded[id] = self._model.from_dict(data)
+        return self._loaded[id]
+
+    def __contains__(self, id):
+        return id in self._raw
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _create_chat_input_args(options, members, users, channels, roles, attachments):
+    """
+    Create the arguments for a ``CHAT_INPUT`` command from its options,
+    using the objects already built from the ``"resolved"`` section.
+
+    Subcommands and subcommand groups are walked with a work list rather than
+    recursion. Discord sends at most one subcommand per level, so the names
+    are added to ``args`` from the outermost group inwards.
+    """
+    SUB_COMMAND = CommandOptionType.SUB_COMMAND
+    SUB_COMMAND_GROUP = CommandOptionType.SUB_COMMAND_GROUP
+    USER = CommandOptionType.USER
+    CHANNEL = CommandOptionType.CHANNEL
+    ROLE = CommandOptionType.ROLE
+    ATTACHMENT = CommandOptionType.ATTACHMENT
+
+    args = []
+    kwargs = {}
+
+    stack = [options]
+    while stack:
+        for option in stack.pop() or ():
+            option_type = option["type"]
+
+            if option_type == SUB_COMMAND or option_type == SUB_COMMAND_GROUP:
+                args.append(option["name"])
+                stack.append(option.get("options"))
+
+            elif option_type == USER:
+                if option["value"] in members:
+                    kwargs[option["name"]] = members[option["value"]]
+                else:
+                    kwargs[option["name"]] = users[option["value"]]
+
+            elif option_type == CHANNEL:
+                kwargs[option["name"]] = channels[option["value"]]
+
+            elif option_type == ROLE:
+                kwargs[option["name"]] = roles[option["value"]]
+
+            elif option_type == ATTACHMENT:
+                kwargs[option["name"]] = attachments[option["value"]]
+
+            else:
+                kwargs[option["name"]] = option["value"]
+
+    return args, kwargs
 
 
 @dataclass
@@ -106,8 +267,29 @@ class Context(LoadableDataclass):
     target_id: str = None
     target: Union[User, Message] = None
 
+    # Not a field: cached by followup_url
+    _followup_base = None
+
     @classmethod
-    def from_data(cls, discord=None, app=None, data={}):
+    def _get_field_factories(cls):
+        """
+        Return ``(name, default_factory)`` pairs for the fields of this class
+        that are declared with a ``default_factory``.
+
+        Computed once per class, like :meth:`LoadableDataclass._get_field_names`.
+        """
+        factories = cls.__dict__.get("_field_factories")
+        if factories is None:
+            factories = tuple(
+                (f.name, f.default_factory)
+                for f in dataclasses.fields(cls)
+                if f.default_factory is not dataclasses.MISSING
+            )
+            cls._field_factories = factories
+        return factories
+
+    @classmethod
+    def from_data(cls, discord=None, app=None, data=None):
         if data is None:
             data = {}
 
@@ -116,37 +298,80 @@ class Context(LoadableDataclass):
         if hasattr(app, "_get_current_object"):
             app = app._get_current_object()
 
-        result = cls(
-            app=app,
-            discord=discord,
-            id=data.get("id"),
-            type=data.get("data", {}).get("type") or ApplicationCommandType.CHAT_INPUT,
-            token=data.get("token"),
-            channel_id=data.get("channel_id"),
-            guild_id=data.get("guild_id"),
-            options=data.get("data", {}).get("options"),
-            values=data.get("data", {}).get("values", []),
-            components=data.get("data", {}).get("components", []),
-            resolved=data.get("data", {}).get("resolved", {}),
-            command_name=data.get("data", {}).get("name"),
-            command_id=data.get("data", {}).get("id"),
-            custom_id=data.get("data", {}).get("custom_id") or "",
-            target_id=data.get("data", {}).get("target_id"),
-            locale=data.get("locale"),
-            guild_locale=data.get("guild_locale"),
-            app_permissions=data.get("app_permissions"),
-        )
+        interaction_data = data.get("data") or _EMPTY_MAPPING
+
+        # Skip the generated __init__ and its keyword argument handling, and
+        # write each field directly instead. This is on the path of every
+        # interaction, so keep it as straight-line assignments rather than a
+        # loop over field names. Fields that aren't set here fall back to their
+        # class-level defaults, except for fields declared with a
+        # default_factory (e.g. by subclasses), which have no class attribute.
+        result = cls.__new__(cls)
+        for name, factory in cls._get_field_factories():
+            setattr(result, name, factory())
+        result.app = app
+        result.discord = discord
+        result.id = data.get("id")
+        result.type = interaction_data.get("type") or ApplicationCommandType.CHAT_INPUT
+        result.token = data.get("token")
+        result.channel_id = data.get("channel_id")
+        result.guild_id = data.get("guild_id")
+        result.options = interaction_data.get("options")
+        result.values = interaction_data.get("values", [])
+        # Replaced with a new list by parse_components below
+        result.components = interaction_data.get("components", ())
+        result.resolved = interaction_data.get("resolved", {})
+        result.command_name = interaction_data.get("name")
+        result.command_id = interaction_data.get("id")
+        result.target_id = interaction_data.get("target_id")
+        result.locale = data.get("locale")
+        result.guild_locale = data.get("guild_locale")
+        result.app_permissions = data.get("app_permissions")
+
+        if hasattr(result, "__post_init__"):
+            result.__post_init__()
 
         result.data = data
 
         result.parse_author(data)
         result.parse_message(data)
-        result.parse_custom_id()
-        result.parse_resolved()
+
+        # Skip parse_custom_id and parse_resolved when there is nothing to
+        # parse, unless a subclass overrides them
+        result.custom_id = interaction_data.get("custom_id") or ""
+        if result.custom_id or cls.parse_custom_id is not Context.parse_custom_id:
+            result.parse_custom_id()
+        else:
+            result.primary_id = ""
+            result.handler_state = [""]
+
+        if result.resolved or cls.parse_resolved is not Context.parse_resolved:
+            result.parse_resolved()
+        else:
+            result.members = {}
+            result.users = {}
+            result.channels = {}
+            result.roles = {}
+            result.messages = {}
+            result.attachments = {}
+
         result.parse_target()
         result.parse_components()
         return result
 
+    @property
+    def _sync_session(self):
+        """
+        The ``requests.Session`` used to send followup requests.
+
+        This is the app's shared session, or a module-level session for
+        frozen contexts, whose stand-in app doesn't carry one.
+        """
+        session = getattr(self.app, "discord_sync_session", None)
+        if session is None:
+            session = _fallback_sync_session()
+        return session
+
     @property
     def auth_headers(self):
         if self.discord:
@@ -196,47 +421,28 @@ class Context(LoadableDataclass):
         handler.
         """
 
-        self.primary_id = self.custom_id.split("\n", 1)[0]
         self.handler_state = self.custom_id.split("\n")
+        self.primary_id = self.handler_state[0]
 
     def parse_resolved(self):
         """
         Parse the ``"resolved"`` section of the incoming interaction data.
 
         This section includes objects representing each user, member, channel,
-        and role passed as an argument to the command.
+        and role passed as an argument to the command. Each object is only
+        built the first time it is looked up, as most handlers only use a few
+        of them.
         """
 
-        self.members = {}
-        for id in self.resolved.get("members", {}):
-            member_info = self.resolved["members"][id]
-            member_info["user"] = self.resolved["users"][id]
-            self.members[id] = Member.from_dict(member_info)
-
-        self.users = {
-            id: User.from_dict(data)
-            for id, data in self.resolved.get("users", {}).items()
-        }
-
-        self.channels = {
-            id: Channel.from_dict(data)
-            for id, data in self.resolved.get("channels", {}).items()
-        }
-
-        self.roles = {
-            id: Role.from_dict(data)
-            for id, data in self.resolved.get("roles", {}).items()
-        }
-
-        self.messages = {
-            id: Message.from_dict(data)
-            for id, data in self.resolved.get("messages", {}).items()
-        }
+        resolved = self.resolved or _EMPTY_MAPPING
+        users = resolved.get("users") or {}
 
-        self.attachments = {
-            id: Attachment.from_dict(data)
-            for id, data in self.resolved.get("messages", {}).items()
-        }
+        self.members = _ResolvedMapping(resolved.get("members"), Member, users)
+        self.users = _ResolvedMapping(users, User)
+        self.channels = _ResolvedMapping(resolved.get("channels"), Channel)
+        self.roles = _ResolvedMapping(resolved.get("roles"), Role)
+        self.messages = _ResolvedMapping(resolved.get("messages"), Message)
+        self.attachments = _ResolvedMapping(resolved.get("attachments"), Attachment)
 
     def parse_target(self):
         """
@@ -245,15 +451,23 @@ class Context(LoadableDataclass):
         For User and Message commands, the target is the relevant user or
         message. This method sets the `ctx.target` field.
         """
-        if self.type == ApplicationCommandType.USER:
-            if self.target_id in self.members:
-                self.target = self.members[self.target_id]
-            else:
-                self.target = self.users[self.target_id]
-        elif self.type == ApplicationCommandType.MESSAGE:
-            self.target = self.messages[self.target_id]
-        else:
-            self.target = None
+        parse = self._TARGET_PARSERS.get(self.type)
+        self.target = getattr(self, parse)() if parse is not None else None
+
+    def _parse_user_target(self):
+        if self.target_id in self.members:
+            return self.members[self.target_id]
+        return self.users[self.target_id]
+
+    def _parse_message_target(self):
+        return self.messages[self.target_id]
+
+    # Map each ApplicationCommandType to the name of the method that finds
+    # its target. Names rather than functions, so subclasses can override them.
+    _TARGET_PARSERS = {
+        ApplicationCommandType.USER: "_parse_user_target",
+        ApplicationCommandType.MESSAGE: "_parse_message_target",
+    }
 
     def parse_components(self):
         self.components = [Component.from_dict(c) for c in self.components]
@@ -263,71 +477,40 @@ class Context(LoadableDataclass):
         Create the arguments which will be passed to the function when the
         :class:`Command` is invoked.
         """
-        if self.type == ApplicationCommandType.CHAT_INPUT:
-            return self.create_args_chat_input()
-        elif self.type == ApplicationCommandType.USER:
-            return [self.target], {}
-        elif self.type == ApplicationCommandType.MESSAGE:
-            return [self.target], {}
+        create_args = self._ARGS_CREATORS.get(self.type)
+        if create_args is not None:
+            return getattr(self, create_args)()
 
     def create_args_chat_input(self):
         """
         Create the arguments for this command, assuming it is a ``CHAT_INPUT``
         command.
         """
+        # from_data always fills in the resolved lookups, but a Context built
+        # directly hasn't parsed its resolved data yet
+        if getattr(self, "users", None) is None:
+            self.parse_resolved()
+
+        return _create_chat_input_args(
+            self.options,
+            self.members,
+            self.users,
+            self.channels,
+            self.roles,
+            self.attachments,
+        )
 
-        def create_args_recursive(data, resolved):
-            if not data.get("options"):
-                return [], {}
-
-            args = []
-            kwargs = {}
-
-            for option in data["options"]:
-                if option["type"] in [
-                    CommandOptionType.SUB_COMMAND,
-                    CommandOptionType.SUB_COMMAND_GROUP,
-                ]:
-
-                    args.append(option["name"])
-
-                    sub_args, sub_kwargs = create_args_recursive(option, resolved)
-
-                    args += sub_args
-                    kwargs.update(sub_kwargs)
-
-                elif option["type"] == CommandOptionType.USER:
-                    if "members" in resolved:
-                        member_data = resolved["members"][option["value"]]
-                        member_data["user"] = resolved["users"][option["value"]]
-
-                        kwargs[option["name"]] = Member.from_dict(member_data)
-                    else:
-                        kwargs[option["name"]] = User.from_dict(
-                            resolved["users"][option["value"]]
-                        )
-
-                elif option["type"] == CommandOptionType.CHANNEL:
-                    kwargs[option["name"]] = Channel.from_dict(
-                        resolved["channels"][option["value"]]
-                    )
-
-                elif option["type"] == CommandOptionType.ROLE:
-                    kwargs[option["name"]] = Role.from_dict(
-                        resolved["roles"][option["value"]]
-                    )
-
-                elif option["type"] == CommandOptionType.ATTACHMENT:
-                    kwargs[option["name"]] = Attachment.from_dict(
-                        resolved["attachments"][option["value"]]
-                    )
-
-                else:
-                    kwargs[option["name"]] = option["value"]
-
-            return args, kwargs
+    def _create_args_target(self):
+        return [self.target], {}
 
-        return create_args_recursive({"options": self.options}, self.resolved)
+    # Map each ApplicationCommandType to the name of the method that creates
+    # its arguments. Names rather than functions, so subclasses can override
+    # them.
+    _ARGS_CREATORS = {
+        ApplicationCommandType.CHAT_INPUT: "create_args_chat_input",
+        ApplicationCommandType.USER: "_create_args_target",
+        ApplicationCommandType.MESSAGE: "_create_args_target",
+    }
 
     def create_handler_args(self, handler):
         """
@@ -342,29 +525,11 @@ class Context(LoadableDataclass):
 
         args = self.handler_state[1:]
 
-        sig = inspect.signature(handler)
-
-        iterator = zip(
-            itertools.count(), args, itertools.islice(sig.parameters.values(), 1, None)
-        )
-
-        for i, argument, parameter in iterator:
-            annotation = parameter.annotation
-
-            if annotation == int:
-                args[i] = int(argument)
-
-            elif annotation == bool:
-                if argument == "True":
-                    args[i] = True
-                elif argument == "False":
-                    args[i] = False
-                elif argument == "None":
-                    args[i] = None
-                else:
-                    raise ValueError(
-                        f"Invalid bool in handler state parsing: {args[i]}"
-                    )
+        for i, (argument, convert) in enumerate(
+            zip(args, _handler_converters(handler))
+        ):
+            if convert is not None:
+                args[i] = convert(argument)
 
         return args
 
@@ -384,14 +549,17 @@ class Context(LoadableDataclass):
             If "@original", refers to the original message.
         """
 
-        url = (
-            f"{self.app.config['DISCORD_BASE_URL']}/webhooks/"
-            f"{self.app.config['DISCORD_CLIENT_ID']}/{self.token}"
-        )
-        if message is not None:
-            url += f"/messages/{message}"
+        # The webhook URL doesn't change for the lifetime of the interaction
+        base = self._followup_base
+        if base is None:
+            base = self._followup_base = (
+                f"{self.app.config['DISCORD_BASE_URL']}/webhooks/"
+                f"{self.app.config['DISCORD_CLIENT_ID']}/{self.token}"
+            )
 
-        return url
+        if message is None:
+            return base
+        return f"{base}/messages/{message}"
 
     def edit(self, updated, message="@original"):
         """
@@ -411,7 +579,7 @@ class Context(LoadableDataclass):
         if not self.app or self.app.config["DONT_REGISTER_WITH_DISCORD"]:
             return
 
-        updated = requests.patch(
+        updated = self._sync_session.patch(
             self.followup_url(message),
             **updated.dump_multipart(),
         )
@@ -431,7 +599,7 @@ class Context(LoadableDataclass):
         if not self.app or self.app.config["DONT_REGISTER_WITH_DISCORD"]:
             return
 
-        response = requests.delete(self.followup_url(message))
+        response = self._sync_session.delete(self.followup_url(message))
         response.raise_for_status()
 
     def send(self, message):
@@ -449,7 +617,9 @@ class Context(LoadableDataclass):
 
         message = Message.from_return_value(message)
 
-        message = requests.post(self.followup_url(), **message.dump_multipart())
+        message = self._sync_session.post(
+            self.followup_url(), **message.dump_multipart()
+        )
         message.raise_for_status()
         return message.json()["id"]
 
@@ -476,20 +646,21 @@ class Context(LoadableDataclass):
             overwrites for the invoking command.
         """
 
+        config = self.app.config
         url = (
-            f"{self.app.config['DISCORD_BASE_URL']}/"
-            f"applications/{self.app.config['DISCORD_CLIENT_ID']}/"
+            f"{config['DISCORD_BASE_URL']}/"
+            f"applications/{config['DISCORD_CLIENT_ID']}/"
             f"guilds/{self.guild_id}/"
             f"commands/{self.get_command(command)}/permissions"
         )
 
         data = [permission.dump() for permission in permissions]
 
-        if self.app.config["DONT_REGISTER_WITH_DISCORD"]:
+        if config["DONT_REGISTER_WITH_DISCORD"]:
             return
 
-        response = requests.put(
-            url, headers=self.auth_headers, json={"permissions": data}
+        response = self._sync_session.put(
+            url, **json_body({"permissions": data}, headers=self.auth_headers)
         )
         response.raise_for_status()
 
@@ -497,17 +668,18 @@ class Context(LoadableDataclass):
         "Return a copy of this Context that can be pickled for RQ and Celery."
 
         app = types.SimpleNamespace()
+        app.config = {key: self.app.config[key] for key in _FROZEN_CONFIG_KEYS}
 
-        CONFIG_KEYS = [
-            "DISCORD_BASE_URL",
-            "DISCORD_CLIENT_ID",
-            "DONT_REGISTER_WITH_DISCORD",
-        ]
+        # Copy the already-parsed state rather than parsing self.data again.
+        # A frozen context is always a plain Context, since the aiohttp
+        # session held by an AsyncContext can't be pickled.
+        new_context = Context.__new__(Context)
+        new_context.__dict__.update(self.__dict__)
+        new_context.__dict__.pop("session", None)
 
-        app.config = {key: self.app.config[key] for key in CONFIG_KEYS}
-
-        new_context = Context.from_data(app=app, data=self.data)
-        new_context.frozen_auth_headers = self.auth_headers
+        new_context.app = app
+        new_context.discord = None
+        new_context.frozen_auth_headers = dict(self.auth_headers)
 
         return new_context
 
@@ -596,6 +768,27 @@ class AsyncContext(Context):
         ) as message:
             return (await message.json())["id"]
 
+    async def send_many(self, messages):
+        """
+        Send several followup messages concurrently over the shared
+        ClientSession.
+
+        The messages are sent at the same time, so Discord may display them
+        in any order. Use :meth:`send` in sequence if the order matters.
+
+        Parameters
+        ----------
+        messages
+            An iterable of Message objects to send as followup messages.
+
+        Returns
+        -------
+        list
+            The IDs of the sent messages, in the same order as ``messages``.
+        """
+
+        return await asyncio.gather(*(self.send(message) for message in messages))
+
     async def overwrite_permissions(self, permissions, command=None):
         """
         Overwrite the permission overwrites for this command.
@@ -609,16 +802,17 @@ class AsyncContext(Context):
             overwrites for the invoking command.
         """
 
+        config = self.app.config
         url = (
-            f"{self.app.config['DISCORD_BASE_URL']}/"
-            f"applications/{self.app.config['DISCORD_CLIENT_ID']}/"
+            f"{config['DISCORD_BASE_URL']}/"
+            f"applications/{config['DISCORD_CLIENT_ID']}/"
             f"guilds/{self.guild_id}/"
             f"commands/{self.get_command(command)}/permissions"
         )
 
         data = [permission.dump() for permission in permissions]
 
-        if not self.app or self.app.config["DONT_REGISTER_WITH_DISCORD"]:
+        if config["DONT_REGISTER_WITH_DISCORD"]:
             return
 
         await self.session.put(
@@ -4,6 +4,7 @@ import uuid
 import atexit
 import asyncio
 import warnings
+from types import MappingProxyType
 
 import requests
 
@@ -20,8 +21,14 @@ except ImportError:
     aiohttp = None
 
 from flask_discord_interactions.command import Command, SlashCommandGroup
-from flask_discord_interactions.context import Context, ApplicationCommandType
+from flask_discord_interactions.context import (
+    Context,
+    ApplicationCommandType,
+    DEFAULT_HTTP_POOL_SIZE,
+    create_sync_session,
+)
 from flask_discord_interactions.models import Message, Modal, ResponseType
+from flask_discord_interactions.models.utils import json_dumps, json_loads
 
 
 class InteractionType:
@@ -326,10 +333,17 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
         app.config.setdefault("DISCORD_CLIENT_SECRET", "")
         app.config.setdefault("DONT_VALIDATE_SIGNATURE", False)
         app.config.setdefault("DONT_REGISTER_WITH_DISCORD", False)
+        app.config.setdefault("DISCORD_HTTP_POOL_SIZE", DEFAULT_HTTP_POOL_SIZE)
         app.discord_commands = self.discord_commands
         app.custom_id_handlers = self.custom_id_handlers
         app.autocomplete_handlers = self.autocomplete_handlers
         app.discord_token = None
+        app.discord_auth_headers = None
+
+        # Reuse HTTPS connections to Discord across followup requests
+        app.discord_sync_session = create_sync_session(
+            app.config["DISCORD_HTTP_POOL_SIZE"]
+        )
 
     def fetch_token(self, app=None):
         """
@@ -347,31 +361,37 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
             app = self.app
 
         if app.config["DONT_REGISTER_WITH_DISCORD"]:
-            app.discord_token = {
+            token = {
                 "token_type": "Bearer",
                 "scope": "applications.commands.update applications.commands.permissions.update",
                 "expires_in": 604800,
                 "access_token": "DONT_REGISTER_WITH_DISCORD",
             }
-            app.discord_token["expires_on"] = (
-                time.time() + app.discord_token["expires_in"] / 2
+        else:
+            response = requests.post(
+                app.config["DISCORD_BASE_URL"] + "/oauth2/token",
+                data={
+                    "grant_type": "client_credentials",
+                    "scope": "applications.commands.update applications.commands.permissions.update",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                auth=(
+                    app.config["DISCORD_CLIENT_ID"],
+                    app.config["DISCORD_CLIENT_SECRET"],
+                ),
             )
-            return
-        response = requests.post(
-            app.config["DISCORD_BASE_URL"] + "/oauth2/token",
-            data={
-                "grant_type": "client_credentials",
-                "scope": "applications.commands.update applications.commands.permissions.update",
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            auth=(app.config["DISCORD_CLIENT_ID"], app.config["DISCORD_CLIENT_SECRET"]),
-        )
 
-        response.raise_for_status()
-        app.discord_token = response.json()
-        app.discord_token["expires_on"] = (
-            time.time() + app.discord_token["expires_in"] / 2
+            response.raise_for_status()
+            token = response.json()
+
+        token["expires_on"] = time.time() + token["expires_in"] / 2
+
+        # Publish the headers before the token, so that anyone who sees the
+        # new token also sees headers built from it
+        app.discord_auth_headers = MappingProxyType(
+            {"Authorization": f"Bearer {token['access_token']}"}
         )
+        app.discord_token = token
 
     def auth_headers(self, app):
         """
@@ -382,11 +402,18 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
         ----------
         app
             The Flask app with the relevant access token.
+
+        Returns
+        -------
+        Mapping
+            A read-only mapping, shared between requests until the token is
+            refreshed. Copy it with ``dict()`` to add more headers.
         """
 
         if app.discord_token is None or time.time() > app.discord_token["expires_on"]:
             self.fetch_token(app)
-        return {"Authorization": f"Bearer {app.discord_token['access_token']}"}
+
+        return app.discord_auth_headers
 
     def update_commands(self, app=None, guild_id=None):
         """
@@ -617,9 +644,6 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
         except BadSignatureError:
             abort(401, "Incorrect Signature")
 
-        if not request.json:
-            abort(400, "Request JSON required")
-
     def set_route(self, route, app=None):
         """
         Add a route handler to the Flask app that handles incoming
@@ -643,23 +667,32 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
         def interactions():
             self.verify_signature(request)
 
-            interaction_type = request.json.get("type")
+            if not request.is_json:
+                abort(415, "Request JSON required")
+
+            try:
+                data = json_loads(request.get_data())
+            except ValueError:
+                data = None
+
+            if not data or not isinstance(data, dict):
+                abort(400, "Request JSON required")
+
+            interaction_type = data.get("type")
             if interaction_type == InteractionType.PING:
                 return jsonify({"type": ResponseType.PONG})
 
             elif interaction_type == InteractionType.APPLICATION_COMMAND:
-                return jsonify(self.run_command(request.json).dump())
+                return jsonify(self.run_command(data).dump())
 
             elif interaction_type == InteractionType.MESSAGE_COMPONENT:
-                return jsonify(self.run_handler(request.json).dump_handler())
+                return jsonify(self.run_handler(data).dump_handler())
 
             elif interaction_type == InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE:
-                return jsonify(self.run_autocomplete(request.json).dump())
+                return jsonify(self.run_autocomplete(data).dump())
 
             elif interaction_type == InteractionType.MODAL_SUBMIT:
-                return jsonify(
-                    self.run_handler(request.json, allow_modal=False).dump_handler()
-                )
+                return jsonify(self.run_handler(data, allow_modal=False).dump_handler())
 
             else:
                 raise RuntimeWarning(
@@ -694,6 +727,9 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
         async def interactions():
             self.verify_signature(request)
 
+            if not request.json:
+                abort(400, "Request JSON required")
+
             interaction_type = request.json.get("type")
             if interaction_type == InteractionType.PING:
                 return jsonify({"type": ResponseType.PONG})
@@ -722,7 +758,9 @@ class DiscordInteractions(DiscordInteractionsBlueprint):
 
         async def create_session():
             app.discord_client_session = aiohttp.ClientSession(
-                headers=self.auth_headers(app), raise_for_status=True
+                headers=self.auth_headers(app),
+                raise_for_status=True,
+                json_serialize=json_dumps,
             )
 
         async def close_session():
@@ -5,7 +5,7 @@ from typing import List, Union
 import json
 from datetime import datetime
 
-from flask_discord_interactions.models.utils import LoadableDataclass
+from flask_discord_interactions.models.utils import LoadableDataclass, json_body
 from flask_discord_interactions.models.component import Component
 from flask_discord_interactions.models.embed import Embed
 
@@ -154,6 +154,10 @@ class Message(LoadableDataclass):
             The function return value to convert into a ``Message`` object.
         """
 
+        # Fast path for the common case of returning a Message
+        if type(result) is cls:
+            return result
+
         async def construct_async(result):
             return cls.from_return_value(await result)
 
@@ -254,8 +258,8 @@ class Message(LoadableDataclass):
         Return this ``Message`` to be sent to an outgoing webhook.
         Handles multipart encoding for file attachments.
 
-        Returns an object that may have ``data``, ``files``, or ``json``
-        fields.
+        Returns an object that may have ``data``, ``files``, ``headers``, or
+        ``json`` fields.
         """
 
         if self.files:
@@ -267,4 +271,4 @@ class Message(LoadableDataclass):
 
             return {"data": {"payload_json": payload_json}, "files": multipart}
         else:
-            return {"json": self.dump_followup()}
+            return json_body(self.dump_followup())
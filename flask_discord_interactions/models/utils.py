@@ -1,7 +1,83 @@
-import inspect
+import dataclasses
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj):
+    """
+    Serialize an object to a JSON ``str``, using orjson if it is installed.
+
+    Parameters
+    ----------
+    obj
+        The object to serialize.
+    """
+    if orjson is None:
+        return json.dumps(obj)
+    return orjson.dumps(obj).decode()
+
+
+def json_loads(data):
+    """
+    Parse a JSON document, using orjson if it is installed.
+
+    Parameters
+    ----------
+    data
+        The ``bytes`` or ``str`` to parse.
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def json_body(payload, headers=None):
+    """
+    Return the keyword arguments needed to send ``payload`` as the JSON body
+    of a ``requests`` or ``aiohttp`` request, using orjson to encode it if it
+    is installed.
+
+    Parameters
+    ----------
+    payload
+        The object to send as JSON.
+    headers
+        Additional headers to send with the request.
+    """
+    if orjson is None:
+        kwargs = {"json": payload}
+        if headers is not None:
+            kwargs["headers"] = headers
+        return kwargs
+
+    return {
+        "data": orjson.dumps(payload),
+        "headers": {**(headers or {}), "Content-Type": "application/json"},
+    }
 
 
 class LoadableDataclass:
+    @classmethod
+    def _get_field_names(cls):
+        """
+        Return the names of the fields that can be passed to the dataclass
+        constructor.
+
+        The names are computed once per class and cached, as the fields of
+        a dataclass do not change after it is defined.
+        """
+        # Look in the class's own namespace so that subclasses (e.g. Member
+        # inheriting from User) compute and cache their own set of fields.
+        names = cls.__dict__.get("_field_names")
+        if names is None:
+            names = frozenset(f.name for f in dataclasses.fields(cls) if f.init)
+            cls._field_names = names
+        return names
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -13,6 +89,5 @@ class LoadableDataclass:
         data
             A dictionary of fields to set on the dataclass.
         """
-        return cls(
-            **{k: v for k, v in data.items() if k in inspect.signature(cls).parameters}
-        )
+        names = cls._get_field_names()
+        return cls(**{k: v for k, v in data.items() if k in names})
@@ -1,4 +1,8 @@
 import json
+import pickle
+from dataclasses import dataclass, field
+
+import pytest
 
 from flask_discord_interactions import Context, Member, Message, ApplicationCommandType
 
@@ -262,3 +266,300 @@ def test_message_command_argument(discord, client):
 
     with client.context(Context(target=Message(content="This is a test."))):
         assert client.run("repeat").content == "I repeat, this is a test."
+
+
+def test_chat_input_resolved_arguments():
+    data = {
+        "type": 2,
+        "token": "UNIQUE_TOKEN",
+        "id": "786008729715212338",
+        "guild_id": "290926798626357999",
+        "channel_id": "645027906669510667",
+        "data": {
+            "id": "771825006014889984",
+            "name": "inspect",
+            "type": 1,
+            "options": [
+                {"name": "user", "type": 6, "value": "53908232506183680"},
+                {"name": "channel", "type": 7, "value": "645027906669510667"},
+                {"name": "role", "type": 8, "value": "539082325061836999"},
+                {"name": "file", "type": 11, "value": "1021163832337129524"},
+                {"name": "count", "type": 4, "value": 3},
+            ],
+            "resolved": {
+                "users": {
+                    "53908232506183680": {
+                        "id": "53908232506183680",
+                        "username": "Mason",
+                        "discriminator": "1337",
+                        "avatar": None,
+                    }
+                },
+                "members": {
+                    "53908232506183680": {
+                        "nick": "Mace",
+                        "roles": ["539082325061836999"],
+                        "permissions": "8",
+                    }
+                },
+                "channels": {
+                    "645027906669510667": {
+                        "id": "645027906669510667",
+                        "name": "general",
+                        "type": 0,
+                    }
+                },
+                "roles": {
+                    "539082325061836999": {
+                        "id": "539082325061836999",
+                        "name": "Admin",
+                    }
+                },
+                "attachments": {
+                    "1021163832337129524": {
+                        "id": "1021163832337129524",
+                        "filename": "notes.txt",
+                        "size": 42,
+                    }
+                },
+            },
+        },
+    }
+
+    context = Context.from_data(data=data)
+    args, kwargs = context.create_args()
+
+    assert args == []
+    assert kwargs["user"] is context.members["53908232506183680"]
+    assert "user" not in data["data"]["resolved"]["members"]["53908232506183680"]
+    assert kwargs["user"].display_name == "Mace"
+    assert kwargs["user"].permissions == 8
+    assert kwargs["channel"].name == "general"
+    assert kwargs["role"].name == "Admin"
+    assert kwargs["file"].filename == "notes.txt"
+    assert kwargs["count"] == 3
+
+
+def test_chat_input_subcommand_arguments():
+    data = {
+        "type": 2,
+        "token": "UNIQUE_TOKEN",
+        "data": {
+            "name": "settings",
+            "type": 1,
+            "options": [
+                {
+                    "name": "notifications",
+                    "type": 2,
+                    "options": [
+                        {
+                            "name": "set",
+                            "type": 1,
+                            "options": [
+                                {"name": "enabled", "type": 5, "value": True},
+                                {"name": "user", "type": 6, "value": "01"},
+                            ],
+                        }
+                    ],
+                }
+            ],
+            "resolved": {"users": {"01": {"id": "01", "username": "Bob"}}},
+        },
+    }
+
+    context = Context.from_data(data=data)
+    args, kwargs = context.create_args()
+
+    assert args == ["notifications", "set"]
+    assert kwargs["enabled"] is True
+    assert kwargs["user"].username == "Bob"
+
+
+def test_custom_id_parsing():
+    context = Context.from_data(
+        data={"type": 3, "data": {"custom_id": "handler\n1\nTrue", "component_type": 2}}
+    )
+
+    assert context.primary_id == "handler"
+    assert context.handler_state == ["handler", "1", "True"]
+    assert context.target is None
+
+    context = Context.from_data(data={"type": 2, "data": {"name": "ping"}})
+
+    assert context.custom_id == ""
+    assert context.primary_id == ""
+    assert context.handler_state == [""]
+    assert context.members == {}
+    assert context.target is None
+
+
+def test_freeze(discord):
+    app = discord.app
+    app.config["DONT_REGISTER_WITH_DISCORD"] = True
+
+    data = {
+        "type": 2,
+        "token": "UNIQUE_TOKEN",
+        "channel_id": "645027906669510667",
+        "member": {"user": {"id": "01", "username": "Bob"}},
+        "data": {
+            "name": "lookup",
+            "type": 1,
+            "options": [{"name": "user", "type": 6, "value": "02"}],
+            "resolved": {"users": {"02": {"id": "02", "username": "Alice"}}},
+        },
+    }
+
+    context = Context.from_data(discord, app, data)
+    frozen = pickle.loads(pickle.dumps(context.freeze()))
+
+    assert type(frozen) is Context
+    assert not hasattr(frozen.app, "discord_sync_session")
+    assert frozen.discord is None
+    assert frozen.token == "UNIQUE_TOKEN"
+    assert frozen.author.username == "Bob"
+    assert frozen.users["02"].username == "Alice"
+    assert frozen.auth_headers == context.auth_headers
+    assert frozen.followup_url() == context.followup_url()
+
+
+def test_followup_url(discord):
+    context = Context.from_data(discord, discord.app, {"token": "UNIQUE_TOKEN"})
+
+    base = (
+        f"{discord.app.config['DISCORD_BASE_URL']}/webhooks/"
+        f"{discord.app.config['DISCORD_CLIENT_ID']}/UNIQUE_TOKEN"
+    )
+
+    assert context.followup_url() == base
+    assert context.followup_url("@original") == f"{base}/messages/@original"
+    assert context.followup_url() == base
+
+
+def test_create_args_subclass_override():
+    @dataclass
+    class CustomContext(Context):
+        def create_args_chat_input(self):
+            return ["custom"], {}
+
+    context = CustomContext.from_data(data={"type": 2, "data": {"name": "ping"}})
+
+    assert context.create_args() == (["custom"], {})
+
+
+def test_resolved_lazy_mappings():
+    data = {
+        "type": 2,
+        "token": "UNIQUE_TOKEN",
+        "data": {
+            "name": "inspect",
+            "type": 1,
+            "options": [{"name": "channel", "type": 7, "value": "10"}],
+            "resolved": {
+                "users": {
+                    "01": {"id": "01", "username": "Bob"},
+                    "02": {"id": "02"},
+                },
+                "members": {
+                    "01": {"nick": "Bobby", "permissions": "8"},
+                    # Malformed, and never looked up by the command
+                    "02": {"permissions": "not a number"},
+                },
+                "channels": {
+                    "10": {"id": "10", "name": "general", "type": 0},
+                    # Malformed, and never looked up by the command
+                    "11": "not a channel",
+                },
+                "roles": {"20": {"id": "20", "name": "Admin"}},
+            },
+        },
+    }
+
+    context = Context.from_data(data=data)
+    args, kwargs = context.create_args()
+
+    assert kwargs["channel"].name == "general"
+    assert kwargs["channel"] is context.channels["10"]
+
+    assert context.members["01"] is context.members["01"]
+    assert context.members["01"].display_name == "Bobby"
+    assert context.users["01"] is context.users["01"]
+
+    assert "01" in context.members
+    assert "03" not in context.members
+    assert len(context.members) == 2
+    assert len(context.channels) == 2
+    assert context.roles.get("20").name == "Admin"
+    assert context.roles.get("21") is None
+    assert context.roles == {"20": context.roles["20"]}
+    assert context.messages == {}
+    assert context.attachments == {}
+
+    # The malformed entries only fail once they are looked up
+    with pytest.raises(ValueError):
+        context.members["02"]
+    with pytest.raises(AttributeError):
+        context.channels["11"]
+
+
+def test_from_data_subclass_default_factory():
+    @dataclass
+    class ContextWithExtra(Context):
+        extra: list = field(default_factory=list)
+
+    first = ContextWithExtra.from_data(data={"type": 2, "data": {"name": "ping"}})
+    second = ContextWithExtra.from_data(data={"type": 2, "data": {"name": "ping"}})
+
+    assert first.extra == []
+    assert first.extra is not second.extra
+    assert first.command_name == "ping"
+
+
+def test_from_data_subclass_parse_hooks():
+    @dataclass
+    class HookedContext(Context):
+        def parse_custom_id(self):
+            super().parse_custom_id()
+            self.primary_id = "hooked"
+
+        def parse_resolved(self):
+            super().parse_resolved()
+            self.hooked_resolved = True
+
+        def parse_target(self):
+            self.target = "hooked"
+
+    context = HookedContext.from_data(data={"type": 2, "data": {"name": "ping"}})
+
+    assert context.primary_id == "hooked"
+    assert context.handler_state == [""]
+    assert context.hooked_resolved
+    assert context.target == "hooked"
+
+
+def test_create_args_constructed_context():
+    context = Context(
+        type=ApplicationCommandType.CHAT_INPUT,
+        options=[
+            {"name": "user", "type": 6, "value": "01"},
+            {"name": "count", "type": 4, "value": 3},
+        ],
+        resolved={"users": {"01": {"id": "01", "username": "Bob"}}},
+    )
+
+    args, kwargs = context.create_args()
+
+    assert args == []
+    assert kwargs["user"].username == "Bob"
+    assert kwargs["count"] == 3
+
+    context = Context(
+        type=ApplicationCommandType.CHAT_INPUT,
+        options=[{"name": "text", "type": 3, "value": "hi"}],
+    )
+    assert context.create_args() == ([], {"text": "hi"})
+
+
+def test_create_args_unknown_type():
+    assert Context().create_args() is None
+    assert Context(type=99).create_args() is None
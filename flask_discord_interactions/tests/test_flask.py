@@ -1,6 +1,9 @@
+import json
 import threading
+import time
 
 from flask import Flask
+from nacl.signing import SigningKey
 
 from flask_discord_interactions import (
     DiscordInteractions,
@@ -129,3 +132,79 @@ def test_followup():
 
     # Make sure we wait for the thread to complete
     ref_to_thread.join()
+
+
+def test_http_pool_size():
+    app = Flask(__name__)
+    app.config["DISCORD_HTTP_POOL_SIZE"] = 42
+
+    DiscordInteractions(app)
+
+    adapter = app.discord_sync_session.get_adapter(app.config["DISCORD_BASE_URL"])
+    assert adapter._pool_maxsize == 42
+
+
+def test_invalid_json():
+    app = Flask(__name__)
+    app.config["DONT_VALIDATE_SIGNATURE"] = True
+    app.config["DONT_REGISTER_WITH_DISCORD"] = True
+
+    discord = DiscordInteractions(app)
+    discord.set_route("/interactions")
+
+    with app.test_client() as client:
+        response = client.post(
+            "/interactions", data='{"type": 1}', content_type="text/plain"
+        )
+        assert response.status_code == 415
+
+        response = client.post("/interactions", json=[])
+        assert response.status_code == 400
+
+        response = client.post("/interactions", json={})
+        assert response.status_code == 400
+
+        response = client.post(
+            "/interactions", data="{not json", content_type="application/json"
+        )
+        assert response.status_code == 400
+
+        response = client.post("/interactions", json={"type": InteractionType.PING})
+        assert response.status_code == 200
+
+
+def test_signed_requests():
+    signing_key = SigningKey.generate()
+
+    app = Flask(__name__)
+    app.config["DISCORD_PUBLIC_KEY"] = signing_key.verify_key.encode().hex()
+    app.config["DONT_REGISTER_WITH_DISCORD"] = True
+
+    discord = DiscordInteractions(app)
+    discord.set_route("/interactions")
+
+    def post(client, body, content_type="application/json", sign=True):
+        timestamp = str(int(time.time()))
+        headers = {"X-Signature-Timestamp": timestamp}
+        if sign:
+            signature = signing_key.sign(timestamp.encode() + body.encode())
+            headers["X-Signature-Ed25519"] = signature.signature.hex()
+        else:
+            headers["X-Signature-Ed25519"] = "00" * 64
+
+        return client.post(
+            "/interactions", data=body, content_type=content_type, headers=headers
+        )
+
+    ping = json.dumps({"type": InteractionType.PING})
+
+    with app.test_client() as client:
+        response = post(client, ping)
+        assert response.status_code == 200
+        assert response.get_json()["type"] == ResponseType.PONG
+
+        assert post(client, ping, sign=False).status_code == 401
+        assert post(client, ping, content_type="text/plain").status_code == 415
+        assert post(client, "{}").status_code == 400
+        assert post(client, "[]").status_code == 400
+        assert post(client, "{not json").status_code == 400
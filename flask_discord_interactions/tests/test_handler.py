@@ -1,3 +1,5 @@
+import pytest
+
 from flask_discord_interactions import Message, ActionRow, Button, ButtonStyles
 
 
@@ -95,3 +97,16 @@ def test_stateful_handler(discord, client):
     client.run("click_counter")
     response = discord.custom_id_handlers[handle_click](None, 0)
     assert response.content == "1 clicks"
+
+
+def test_annotated_handler_state(discord, client):
+    @discord.custom_handler()
+    def handle_typed(ctx, count: int, flag: bool, label):
+        return f"{count + 1} {flag} {label}"
+
+    assert client.run_handler(handle_typed, "41", "True", "x").content == "42 True x"
+    assert client.run_handler(handle_typed, "0", "None", "y").content == "1 None y"
+
+    with pytest.raises(ValueError) as excinfo:
+        client.run_handler(handle_typed, "0", "maybe", "z")
+    assert excinfo.value.__context__ is None or excinfo.value.__suppress_context__
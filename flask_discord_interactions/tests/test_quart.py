@@ -1,4 +1,6 @@
 import asyncio
+import json
+from types import SimpleNamespace
 
 import pytest
 from quart import Quart
@@ -80,3 +82,73 @@ async def test_followup(quart_discord):
     with client.context(AsyncContext()):
         await client.run("followup")
     await followup_task
+
+
+@pytest.mark.asyncio
+async def test_send_many(quart_discord):
+    discord, client = quart_discord
+
+    followup_task = None
+
+    @discord.command()
+    async def several_followups(ctx):
+        nonlocal followup_task
+
+        async def do_followup():
+            return await ctx.send_many([Message("One"), "Two"])
+
+        followup_task = asyncio.create_task(do_followup())
+        return Message(deferred=True)
+
+    with client.context(AsyncContext()):
+        await client.run("several_followups")
+    assert await followup_task == [None, None]
+
+
+class FakeResponse:
+    def __init__(self, message_id, delay):
+        self.message_id = message_id
+        self.delay = delay
+
+    async def __aenter__(self):
+        # Finish out of order, so the results have to be put back in order
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def json(self):
+        return {"id": self.message_id}
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def post(self, url, **kwargs):
+        self.urls.append(url)
+        # The body is sent as bytes when orjson is installed
+        payload = kwargs["json"] if "json" in kwargs else json.loads(kwargs["data"])
+        content = payload["content"]
+        delay = {"One": 0.03, "Two": 0.02, "Three": 0.01}[content]
+        return FakeResponse(f"id-{content}", delay)
+
+
+@pytest.mark.asyncio
+async def test_send_many_ids_in_order():
+    session = FakeSession()
+    app = SimpleNamespace(
+        config={
+            "DONT_REGISTER_WITH_DISCORD": False,
+            "DISCORD_BASE_URL": "https://discord.com/api/v10",
+            "DISCORD_CLIENT_ID": "123",
+        },
+        discord_client_session=session,
+    )
+    ctx = AsyncContext(app=app, token="token")
+
+    ids = await ctx.send_many([Message("One"), "Two", Message("Three")])
+
+    assert ids == ["id-One", "id-Two", "id-Three"]
+    assert session.urls == ["https://discord.com/api/v10/webhooks/123/token"] * 3
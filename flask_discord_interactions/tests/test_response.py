@@ -146,3 +146,26 @@ def test_dump_multipart():
         assert resp.dump_multipart() == expected
     finally:
         fp.close()
+
+
+def test_dump_multipart_json():
+    resp = Message(content="Followup")
+
+    kwargs = resp.dump_multipart()
+
+    if "json" in kwargs:
+        payload = kwargs["json"]
+    else:
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        payload = json.loads(kwargs["data"])
+
+    assert payload == resp.dump_followup()
+
+
+def test_from_return_value():
+    message = Message(content="Hello")
+
+    assert Message.from_return_value(message) is message
+    assert Message.from_return_value("Hello").content == "Hello"
+    assert Message.from_return_value(42).content == "42"
+    assert Message.from_return_value(None).content is None
@@ -19,7 +19,7 @@ setup(
     include_package_data=True,
     platforms="any",
     install_requires=["Flask", "requests", "PyNaCl"],
-    extras_require={"async": ["Quart", "aiohttp"]},
+    extras_require={"async": ["Quart", "aiohttp"], "speedups": ["orjson"]},
     tests_require=["pytest"],
     classifiers=[
         "Environment :: Web Environment",